@@ -25,6 +25,9 @@ setup(
     install_requires=[
         'mohawk>=1.1.0',
         'requests>=2.25.1',
+        'orjson>=3.6.0',
+        'ijson>=3.1',
+        'httpx[http2]>=0.23.0',
         'urllib3>=1.26.4',
         'GitPython>=3.1.14',
         'gunicorn>=20.1.0',
@@ -5,23 +5,192 @@ All response objects are returned in a POSTable format, so we can store them on
 them later).
 """
 
-from typing import Optional, Dict, Callable, Any
+from typing import Optional, Dict, Callable, Any, List, Type, FrozenSet, Mapping, Iterator, Tuple, Union
 
 import logging
 import requests
 import json
+import orjson
+import ijson
+import urllib3
 
 from urllib.error import URLError
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from mohawk import Sender
 from functools import wraps
-from time import sleep
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from time import sleep, monotonic
+from threading import Lock
+from collections import OrderedDict
+from random import uniform
+from itertools import count
 from http import HTTPStatus
 
 
+_BASE_URL = 'https://api.threatstack.com/v2'
+
+# Endpoint URL templates, bound once to their `format` methods.
+_RULESETS_URL = f'{_BASE_URL}/rulesets'
+_RULESET_URL = (_BASE_URL + '/rulesets/{}').format
+_RULESET_RULES_URL = (_BASE_URL + '/rulesets/{}/rules').format
+_RULE_URL = (_BASE_URL + '/rulesets/{}/rules/{}').format
+_TAGS_URL = (_BASE_URL + '/rules/{}/tags').format
+
+# Non-POSTable fields returned by TS, cf. https://apidocs.threatstack.com/v2/rule-sets-and-rules/create-rule-endpoint
+_STRIP_RULESET = frozenset(('updatedAt', 'createdAt'))
+_STRIP_RULE = frozenset(('rulesetId', 'updatedAt', 'createdAt'))
+_STRIP_RULE_ID = _STRIP_RULE | {'id'}
+
+# Aggregate fields that TS has apparently deprecated, and are also non-POSTable.
+_STRIP_AGGREGATE = frozenset(('rule_id',))
+
+# Bound every request, so a hung connection surfaces as an exception (and is retried) instead of blocking forever.
+# Read timeouts are retried only by `retry(tries=5)` on GET, PUT and DELETE, never by the adapter, so such a call whose
+# responses all hang takes at most 5 * (3.05 + 30) s plus `retry`'s backoff (~8 s): about three minutes. POSTs aren't
+# retried once sent (cf. `_POST_RETRYABLE`), so a hung POST gives up after a single 3.05 + 30 s. When TS is unreachable,
+# each try first spends up to 4 * 3.05 s (plus ~3 s of backoff) on the adapter's connect retries, which bounds that
+# case at roughly 1.5 minutes for any method.
+_TIMEOUT = (3.05, 30.0)
+
+# Failures on which requests are backed off and retried. Connection errors only surface here once urllib3 has exhausted
+# its connect retries (cf. `_ADAPTER_RETRY`); read timeouts and dropped responses are only ever retried here.
+_RETRYABLE = (URLError, requests.exceptions.Timeout, requests.exceptions.ConnectionError)
+
+# POSTs aren't idempotent: a read timeout or dropped connection may come after TS has already committed the request,
+# and re-sending it would create a duplicate rule or ruleset. So only retry failures where nothing reached TS.
+_POST_RETRYABLE = (URLError, requests.exceptions.ConnectTimeout)
+
+# urllib3 only retries failed connection attempts inside the adapter, where no request has reached TS yet. Anything it
+# would retry after sending replays the original Hawk header (timestamp and nonce included), which TS may reject, and
+# could duplicate a POST that TS already committed. So 5xx responses and read errors go back through `retry` below,
+# which re-signs every attempt.
+_ADAPTER_RETRY = Retry(
+    total=3,
+    connect=3,
+    read=0,
+    status=0,
+    backoff_factor=0.5,
+    status_forcelist=(),
+    allowed_methods=frozenset(('GET', 'PUT', 'DELETE')),
+    raise_on_status=False
+)
+
+
+def _strip_fields(data: Dict, fields: FrozenSet[str]) -> None:
+    """
+    Remove non-POSTable fields (and deprecated aggregate fields, on rules) in place.
+
+    Args:
+        data: ruleset or rule data as returned by TS.
+        fields: top-level fields to remove.
+
+    Returns:
+        Nothing.
+    """
+    for field in fields:
+        data.pop(field, None)
+
+    if 'aggregateFields' in data:
+        data['aggregateFields'] = [f for f in data['aggregateFields'] if f not in _STRIP_AGGREGATE]
+
+
+def _clean(response: Optional[Dict], fields: FrozenSet[str] =frozenset(), rule_fields: Optional[FrozenSet[str]] =None,
+           rename_rules: bool =False) -> Optional[Dict]:
+    """
+    Put a TS response into POSTable format in place; shared by every endpoint method. Error responses are returned
+    untouched.
+
+    Args:
+        response: the decoded response.
+        fields: top-level fields to remove.
+        rule_fields: if set, fields to remove from each rule listed under the response's 'rules'.
+        rename_rules: whether to rename the response's 'rules' field to 'ruleIds'.
+
+    Returns:
+        The same response.
+    """
+    if response and 'errors' not in response:
+        _strip_fields(response, fields)
+
+        if rule_fields is not None:
+            for rule in response['rules']:
+                _strip_fields(rule, rule_fields)
+
+        if rename_rules:
+            _rename_rules(response)
+
+    return response
+
+
+def _rename_rules(ruleset: Dict) -> None:
+    """
+    TS returns a ruleset's rules under 'rules', but only accepts them under 'ruleIds'; rename the field in place so
+    the data are POSTable.
+
+    Args:
+        ruleset: ruleset data as returned by TS.
+
+    Returns:
+        Nothing.
+    """
+    ruleset['ruleIds'] = ruleset.pop('rules')
+
+
+def _decode(status_code: int, headers: Mapping[str, str], content: bytes, reason: str) -> Dict:
+    """
+    Decode a TS response, checking for rate limiting before any attempt at parsing the body. Takes the response's parts
+    rather than the response itself, so that both `API` and `api_async.AsyncAPI` may share it.
+
+    Other error codes are still decoded, since TS describes them in a JSON 'errors' field that callers inspect.
+
+    Args:
+        status_code: the response's status code.
+        headers: the response's headers.
+        content: the response's raw body.
+        reason: the response's reason phrase.
+
+    Returns:
+        The decoded response body.
+
+    Raises:
+        RateLimitedError: on HTTPStatus.TOO_MANY_REQUESTS.
+        URLError: if the body isn't valid JSON.
+    """
+    if status_code == HTTPStatus.TOO_MANY_REQUESTS:
+        raise RateLimitedError.from_headers(headers)
+
+    try:
+        return orjson.loads(content)
+    except orjson.JSONDecodeError:
+        raise URLError(
+            f'Did not get valid JSON in response: {content[:200].decode("utf-8", "replace") or reason} ~ {status_code}'
+        )
+
+
+def _backoff_delays(delay: float =0.5, backoff: float =2.0, max_delay: float =30.0) -> Iterator[float]:
+    """
+    Capped exponential backoff with jitter; cf. `retry`.
+
+    Args:
+        delay: initial number of seconds to wait between failed calls.
+        backoff: factor by which the delay grows after each failed call.
+        max_delay: upper bound on the delay between failed calls.
+
+    Returns:
+        An endless iterator over the number of seconds to wait after each successive failure.
+    """
+    while True:
+        yield delay + uniform(0, delay * 0.1)
+        delay = min(delay * backoff, max_delay)
+
+
 class RateLimitedError(Exception):
     """
     Raised when an HTTPStatus.TOO_MANY_REQUESTS code is received.
     """
+    __slots__ = ('message', 'delay')
+
     def __init__(self, message: str ='', delay: float =30.0) -> None:
         super().__init__(message)
         self.message = message
@@ -30,17 +199,54 @@ class RateLimitedError(Exception):
     def __str__(self):
         return f'RateLimitError(message="{self.message}", code="{HTTPStatus.TOO_MANY_REQUESTS}", "x-rate-limit-reset={self.delay}")'
 
+    @classmethod
+    def from_headers(cls: Type['RateLimitedError'], headers: Mapping[str, str]) -> 'RateLimitedError':
+        """
+        Build an error from a rate-limited response's headers, honoring the server's requested delay.
+
+        Args:
+            headers: headers of the HTTPStatus.TOO_MANY_REQUESTS response.
 
-def retry(tries: int) -> Callable:
+        Returns:
+            A RateLimitedError whose `delay` is the time to wait before the next request.
+        """
+        if 'Retry-After' in headers:
+            try:
+                return cls(delay=float(headers['Retry-After']))
+            except ValueError:
+                # An HTTP-date; fall back to TS' own header below.
+                pass
+        if 'x-rate-limit-reset' in headers:
+            # Delay the minimal amount of time we can before running another request. `time.sleep` also isn't that
+            # accurate, so I add 1/4s for good measure, which is barely noticeable.
+            return cls(delay=float(headers['x-rate-limit-reset']) / 1_000 + 0.25)
+        return cls()
+
+
+class RetryLimitExceeded(URLError):
+    """
+    Raised when a request has failed on every one of its allotted tries.
     """
-    A request retry decorator. If singledispatch becomes compatible with `typing`, it'd be cool to duplicate this
-    registering another dispatch on `f`, essentially removing a layer.
+
+
+def retry(tries: int, delay: float =0.5, backoff: float =2.0, max_delay: float =30.0,
+          exceptions: Tuple[Type[Exception], ...] =(URLError,)) -> Callable:
+    """
+    A request retry decorator with capped exponential backoff and jitter. If singledispatch becomes compatible with
+    `typing`, it'd be cool to duplicate this registering another dispatch on `f`, essentially removing a layer.
 
     Args:
         tries: number of times to retry the wrapped function call. When `0`, retries indefinitely.
+        delay: initial number of seconds to wait between failed calls.
+        backoff: factor by which the delay grows after each failed call.
+        max_delay: upper bound on the delay between failed calls.
+        exceptions: exception types on which to back off and retry (RateLimitedError is always retried).
 
     Returns:
-        Either the result of a successful function call (be it via retrying or not).
+        The result of a successful function call (be it via retrying or not).
+
+    Raises:
+        RetryLimitExceeded: if every try failed.
     """
     if tries < 0:
         raise ValueError(f'Expected positive `tries` values, received: {tries}')
@@ -48,30 +254,27 @@ def retry(tries: int) -> Callable:
     def _f(f: Callable) -> Callable:
         @wraps(f)
         def new_f(*args: Any, **kwargs: Any) -> Optional[Dict]:
-            res: Any = None
-
-            def call() -> bool:
-                nonlocal res
+            delays = _backoff_delays(delay, backoff, max_delay)
+            last_exc: Optional[Exception] = None
+            for attempt in (count(1) if tries == 0 else range(1, tries + 1)):
                 try:
-                    res = f(*args, **kwargs)
-                    return True
+                    return f(*args, **kwargs)
                 except RateLimitedError as msg:
-                    sleep(msg.delay)
-                    return False
-                except URLError as msg:
-                    return False
-
-            if tries > 0:
-                for _ in range(tries):
-                    if call():
-                        return res
-                else:
-                    return
-            else:
-                while not call():
-                    pass
-                else:
-                    return res
+                    logging.info('Retrying: %s', msg)
+                    last_exc = msg
+                    # Don't make the caller wait just to receive the error.
+                    if attempt == tries:
+                        break
+                    # TS tells us how long to wait; jitter keeps concurrent callers from retrying in lockstep.
+                    sleep(msg.delay + uniform(0, delay))
+                except exceptions as msg:
+                    logging.info('Retrying: %s', msg)
+                    last_exc = msg
+                    if attempt == tries:
+                        break
+                    sleep(next(delays))
+
+            raise RetryLimitExceeded(f'{f.__name__} failed after {tries} tries: {last_exc}') from last_exc
 
         return new_f
 
@@ -83,6 +286,10 @@ def paginate(aggregate_field: str) -> Callable:
     For rules and rulesets, I don't think pagination is yet necessary. When I eventually implement a tasks subparser,
     I could add this on the GET endpoint wrapping the retry.
 
+    The wrapped function must accept a `token` keyword argument (the page to request, `None` for the first) and return
+    that page's response. Pages are requested lazily as the returned iterator is consumed, so large result sets are never
+    concatenated in memory.
+
     Args:
         aggregate_field: on endpoints that have pagination, like GET servers, they usually have a field pointing to a
             list of returned items (objects themselves), such as 'alerts', 'servers', etc. For rule managementm, there
@@ -90,24 +297,18 @@ def paginate(aggregate_field: str) -> Callable:
             on additional methods to allow tsctl.tasks to work.
 
     Returns:
-        Dictionary of the concatenated/aggregated results, with a null token.
+        An iterator over the items of every page, in order.
     """
     def _f(f: Callable) -> Callable:
         @wraps(f)
-        def new_f(*args: Any, **kwargs: Any) -> Dict:
-            aggregate = {
-                aggregate_field: [],
-                'token': None
-            }
+        def new_f(*args: Any, token: Optional[str] =None, **kwargs: Any) -> Iterator[Dict]:
             while True:
-                res = f(*args, **kwargs)
-                if aggregate_field in res:
-                    aggregate[aggregate_field] += res[aggregate_field]
-                    if res['token'] == '' or res['token'] is None:
-                        break
-                else:
+                res = f(*args, token=token, **kwargs)
+                if aggregate_field not in res:
                     raise KeyError(f'Fatal - aggregate field \'{aggregate_field}\' doesn\'t exist on this endpoint.')
-            return aggregate
+                yield from res[aggregate_field]
+                if not (token := res.get('token')):
+                    return
         return new_f
     return _f
 
@@ -116,7 +317,24 @@ class API:
     """
     API object that provides a higher level interface to the remote organizations' state.
     """
-    def __init__(self, user_id: str, api_key: str, org_id: str) -> None:
+    __slots__ = (
+        '_user', '_key', '_ext', '_credentials', '_auth_cache_ttl', '_auth_cache', '_auth_cache_lock', '_session',
+        '_pool_maxsize'
+    )
+
+    # Upper bound on the number of cached GET Authorization headers (cf. `auth_cache_ttl`).
+    _AUTH_CACHE_SIZE = 256
+
+    def __init__(self, user_id: str, api_key: str, org_id: str, auth_cache_ttl: int =0) -> None:
+        """
+        Args:
+            user_id: TS user ID.
+            api_key: TS API key.
+            org_id: TS organization ID.
+            auth_cache_ttl: when nonzero, reuse a GET request's Hawk Authorization header for the same URL for up to this
+                many seconds, rather than signing every request. Hawk servers that track nonces will reject the reused
+                header, so only enable this if the remote permits it; disabled by default.
+        """
         self._user = user_id
         self._key = api_key
         self._ext = org_id
@@ -127,31 +345,106 @@ class API:
             'algorithm': 'sha256'
         }
 
-        self._sender: Optional[Sender] = None
-        self._header: Optional[str] = None
+        self._auth_cache_ttl = auth_cache_ttl
+        self._auth_cache: 'OrderedDict[Tuple[str, int], str]' = OrderedDict()
+        self._auth_cache_lock = Lock()
+
+        # Reuse one session (and its urllib3 connection pool) across requests, so we aren't paying for a new TCP and TLS
+        # handshake with api.threatstack.com on every call.
+        self._session = requests.Session()
+        self._pool_maxsize = 0
+        self._mount_adapter(16)
+        self._session.headers.update({'Content-Type': 'application/json'})
+
+    def __enter__(self) -> 'API':
+        return self
 
-    def _update_sender(self, url: str, method: str, data: Optional[Dict] =None) -> None:
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
         """
-        Update the retrieved token.
+        Close the underlying session and release any pooled connections.
+
+        Returns:
+            Nothing.
+        """
+        self._session.close()
+
+    def _mount_adapter(self, pool_maxsize: int) -> None:
+        """
+        (Re)mount the session's HTTPS adapter if its connection pool is smaller than requested, so concurrent requests
+        aren't serialized on urllib3's pool.
 
         Args:
-            url: url on which we are about to make a request.
+            pool_maxsize: minimum number of connections to keep pooled per host.
 
         Returns:
             Nothing.
         """
-        self._sender = Sender(
+        if pool_maxsize > self._pool_maxsize:
+            # Release the connections held by the adapter being replaced.
+            if (adapter := self._session.adapters.get('https://')) is not None:
+                adapter.close()
+            self._session.mount(
+                'https://',
+                HTTPAdapter(pool_connections=4, pool_maxsize=pool_maxsize, max_retries=_ADAPTER_RETRY)
+            )
+            self._pool_maxsize = pool_maxsize
+
+    def _sign(self, url: str, method: str, content: Optional[str] =None) -> str:
+        """
+        Sign a request with Hawk Auth. This is safe to call from several threads.
+
+        Args:
+            url: url on which we are about to make a request.
+            method: HTTP method of the request.
+            content: the serialized request body, exactly as it will be sent.
+
+        Returns:
+            The Authorization header for this request.
+        """
+        if not self._auth_cache_ttl or method != 'GET':
+            return self._new_header(url, method, content)
+
+        key = (url, int(monotonic() // self._auth_cache_ttl))
+        with self._auth_cache_lock:
+            if key in self._auth_cache:
+                self._auth_cache.move_to_end(key)
+                return self._auth_cache[key]
+
+        header = self._new_header(url, method, content)
+
+        with self._auth_cache_lock:
+            self._auth_cache[key] = header
+            if len(self._auth_cache) > self._AUTH_CACHE_SIZE:
+                self._auth_cache.popitem(last=False)
+
+        return header
+
+    def _new_header(self, url: str, method: str, content: Optional[str] =None) -> str:
+        """
+        Compute a fresh Hawk Authorization header; cf. `_sign`.
+
+        Args:
+            url: url on which we are about to make a request.
+            method: HTTP method of the request.
+            content: the serialized request body, exactly as it will be sent.
+
+        Returns:
+            The Authorization header for this request.
+        """
+        return Sender(
             credentials=self._credentials,
             url=url,
-            content=json.dumps(data) if data else data,
+            content=content,
             method=method,
             always_hash_content=False,
             content_type='application/json',
             ext=self._ext
-        )
-        self._header = self._sender.request_header
+        ).request_header
 
-    @retry(tries=5)
+    @retry(tries=5, exceptions=_RETRYABLE)
     def _get(self, url: str) -> Optional[Dict]:
         """
         GET request on a TS API endpoint using Hawk Auth.
@@ -162,27 +455,47 @@ class API:
         Returns:
             A response on that endpoint, or nothing if an error is returned.
         """
-        self._update_sender(url, 'GET')
+        header = self._sign(url, 'GET')
 
-        response = requests.get(
-            url=url,
-            headers={
-                'Authorization': self._header,
-                'Content-Type': 'application/json'
-            }
+        response = self._session.get(
+            url,
+            headers={'Authorization': header},
+            timeout=_TIMEOUT
         )
 
-        try:
-            return response.json()
-        except json.JSONDecodeError:
-            if response.status_code == HTTPStatus.TOO_MANY_REQUESTS:
-                # Delay the minimal amount of time we can before running another request. `time.sleep` also isn't
-                # that accurate, so I add 1/4s for good measure, which is barely noticeable.
-                raise RateLimitedError(delay=float(response.headers['x-rate-limit-reset']) / 1_000 + 0.25)
-            else:
-                raise URLError(
-                    f'Did not get valid JSON in response: {response.text if response.text else response.reason} ~ {response.status_code}'
-                )
+        return _decode(response.status_code, response.headers, response.content, response.reason)
+
+    @retry(tries=5, exceptions=_RETRYABLE)
+    def _get_stream(self, url: str) -> Union[requests.Response, Dict]:
+        """
+        GET request on a TS API endpoint using Hawk Auth, leaving a successful response's body unread so it may be
+        parsed incrementally.
+
+        Args:
+            url: the url (including endpoint and content) on which to make the request.
+
+        Returns:
+            The open response, which callers are responsible for closing; or, on an error status, the decoded response
+            (TS' 'errors' body), exactly as `_get` would return it.
+        """
+        header = self._sign(url, 'GET')
+
+        response = self._session.get(
+            url,
+            headers={'Authorization': header},
+            timeout=_TIMEOUT,
+            stream=True
+        )
+
+        if not response.ok:
+            # Error responses are handled exactly as `_get` handles them (rate limiting and non-JSON bodies are retried,
+            # TS' 'errors' bodies are returned); they're small, so there's nothing to gain from streaming them.
+            with response:
+                return _decode(response.status_code, response.headers, response.content, response.reason)
+
+        # Let urllib3 undo any gzip content-encoding before ijson sees the bytes.
+        response.raw.decode_content = True
+        return response
 
     def get_rulesets(self) -> Optional[Dict]:
         """
@@ -193,16 +506,11 @@ class API:
         Returns:
             A dictionary of rulesets and their rules.
         """
-        if (response := self._get('https://api.threatstack.com/v2/rulesets')) and 'errors' not in response:
+        if (response := self._get(_RULESETS_URL)) and 'errors' not in response:
             # Due to an inconsistency in field name, remove 'rules'; cf. `get_ruleset` and `get_ruleset_rules` for a
             # similar callout.
-            rulesets = []
             for ruleset in response['rulesets']:
-                ruleset_id = ruleset['id']
-                ruleset['ruleIds'] = ruleset['rules']
-                ruleset.pop('rules')
-                rulesets.append(ruleset)
-            response['rulesets'] = rulesets
+                _rename_rules(ruleset)
 
         return response
 
@@ -218,16 +526,8 @@ class API:
         Returns:
             The ruleset and rule IDs thereunder.
         """
-        if (response := self._get(f'https://api.threatstack.com/v2/rulesets/{ruleset_id}')) and 'errors' not in response:
-            for field in ('updatedAt', 'createdAt'):
-                if field in response:
-                    response.pop(field)
-
-            # Fix an inconsistency with our returned field names. Again, I want to store these data in POSTable format.
-            response['ruleIds'] = response['rules']
-            response.pop('rules')
-
-        return response
+        # Fix an inconsistency with our returned field names. Again, I want to store these data in POSTable format.
+        return _clean(self._get(_RULESET_URL(ruleset_id)), _STRIP_RULESET, rename_rules=True)
 
     def get_ruleset_rules(self, ruleset_id: str) -> Optional[Dict]:
         """
@@ -241,29 +541,67 @@ class API:
         Returns:
             The ruleset and a verbose listing of the rules underneath it.
         """
-        if (response := self._get(f'https://api.threatstack.com/v2/rulesets/{ruleset_id}/rules')) and 'errors' not in response:
-            # Filter rules' fields.
-            for i, rule in enumerate(response['rules']):
-                # Remove non-POSTable fields by
-                # https://apidocs.threatstack.com/v2/rule-sets-and-rules/create-rule-endpoint
-                for field in ('rulesetId', 'updatedAt', 'createdAt'):
-                    if field in rule:
-                        rule.pop(field)
+        # As with `get_ruleset` above, this endpoint is also plagued by an inconsistency in returned field name that is
+        # not POSTable.
+        return _clean(self._get(_RULESET_RULES_URL(ruleset_id)), rule_fields=_STRIP_RULE, rename_rules=True)
 
-                # Remove non-POSTable aggregate fields that TS has apparently deprecated.
-                if 'aggregateFields' in rule:
-                    for field in ('rule_id',):
-                        if field in rule['aggregateFields']:
-                            rule['aggregateFields'].remove(field)
+    def get_ruleset_rules_stream(self, ruleset_id: str) -> Iterator[Dict]:
+        """
+        Like `get_ruleset_rules`, but parse the response incrementally and yield one (filtered) rule at a time, so large
+        rulesets never have to be held in memory alongside their raw response.
 
-                response['rules'][i] = rule
+        Args:
+            ruleset_id: ruleset under which to retrieve all rules.
 
-            # As with `get_ruleset` above, this endpoint is also plagued by an inconsistency in returned field name that
-            # is not POSTable.
-            response['ruleIds'] = response['rules']
-            response.pop('rules')
+        Returns:
+            An iterator over the ruleset's rules, in POSTable format.
 
-        return response
+        Raises:
+            URLError: if TS returned an 'errors' body (which, being a generator, this can't return the way
+                `get_ruleset_rules` does), or if the response couldn't be read or parsed.
+        """
+        response = self._get_stream(_RULESET_RULES_URL(ruleset_id))
+
+        if isinstance(response, dict):
+            raise URLError(response)
+
+        with response:
+            try:
+                for rule in ijson.items(response.raw, 'rules.item', use_float=True):
+                    _strip_fields(rule, _STRIP_RULE)
+                    yield rule
+            except (ijson.JSONError, urllib3.exceptions.HTTPError, requests.exceptions.RequestException) as msg:
+                # ijson reads `response.raw` directly, so network failures mid-stream surface as urllib3's exceptions
+                # (ReadTimeoutError, ProtocolError, DecodeError) rather than being converted by requests.
+                raise URLError(f'Could not read streamed response: {msg}') from msg
+
+    def get_all_ruleset_rules(self, ruleset_ids: List[str], max_workers: int =8) -> Dict[str, Optional[Dict]]:
+        """
+        Retrieve the rules under several rulesets concurrently. These requests are I/O-bound, so fanning them out over
+        the shared session brings the wall time down to roughly that of the slowest request.
+
+        Args:
+            ruleset_ids: rulesets under which to retrieve all rules.
+            max_workers: maximum number of requests in flight at once.
+
+        Returns:
+            A dictionary mapping each ruleset ID to the response `get_ruleset_rules` returned for it.
+        """
+        self._mount_adapter(max_workers)
+
+        results: Dict[str, Optional[Dict]] = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(self.get_ruleset_rules, ruleset_id): ruleset_id for ruleset_id in ruleset_ids}
+            try:
+                for future in as_completed(futures):
+                    results[futures[future]] = future.result()
+            except BaseException:
+                # Don't make the caller wait out every other fetch (and its retries) before seeing this failure.
+                for future in futures:
+                    future.cancel()
+                raise
+
+        return results
 
     def get_rule(self, ruleset_id: str, rule_id: str) -> Optional[Dict]:
         """
@@ -278,18 +616,7 @@ class API:
         Returns:
             The rule data.
         """
-        if (response := self._get(f'https://api.threatstack.com/v2/rulesets/{ruleset_id}/rules/{rule_id}')) and 'errors' not in response:
-            for field in ('id', 'rulesetId', 'updatedAt', 'createdAt'):
-                if field in response:
-                    response.pop(field)
-
-            # Remove non-POSTable aggregate fields that TS has apparently deprecated.
-            if 'aggregateFields' in response:
-                for field in ('rule_id',):
-                    if field in response['aggregateFields']:
-                        response['aggregateFields'].remove(field)
-
-        return response
+        return _clean(self._get(_RULE_URL(ruleset_id, rule_id)), _STRIP_RULE_ID)
 
     def get_rule_tags(self, rule_id: str) -> Optional[Dict]:
         """
@@ -303,14 +630,9 @@ class API:
         Returns:
             The tag data.
         """
-        if (response := self._get(f'https://api.threatstack.com/v2/rules/{rule_id}/tags')) and 'errors' not in response:
-            for field in ('errors',):
-                if field in response:
-                    response.pop(field)
+        return self._get(_TAGS_URL(rule_id))
 
-        return response
-
-    @retry(tries=5)
+    @retry(tries=5, exceptions=_RETRYABLE)
     def _put(self, url: str, data: Dict) -> Optional[Dict]:
         """
         PUT request on a TS API endpoint using Hawk Auth.
@@ -321,26 +643,17 @@ class API:
         Returns:
             A response on that endpoint, or nothing if an error is returned.
         """
-        self._update_sender(url, 'PUT', data)
+        content = json.dumps(data)
+        header = self._sign(url, 'PUT', content)
 
-        response = requests.put(
-            url=url,
-            data=json.dumps(data),
-            headers={
-                'Authorization': self._header,
-                'Content-Type': 'application/json'
-            }
+        response = self._session.put(
+            url,
+            data=content,
+            headers={'Authorization': header},
+            timeout=_TIMEOUT
         )
 
-        try:
-            return response.json()
-        except json.JSONDecodeError:
-            if response.status_code == HTTPStatus.TOO_MANY_REQUESTS:
-                raise RateLimitedError(delay=float(response.headers['x-rate-limit-reset']) / 1_000 + 0.25)
-            else:
-                raise URLError(
-                    f'Did not get valid JSON in response: {response.text if response.text else response.reason} ~ {response.status_code}'
-                )
+        return _decode(response.status_code, response.headers, response.content, response.reason)
 
     def put_ruleset(self, ruleset_id: str, data: Dict) -> Optional[Dict]:
         """
@@ -355,12 +668,7 @@ class API:
         Returns:
             The response from the platform when the request is successful, nothing otherwise.
         """
-        if (response := self._put(f'https://api.threatstack.com/v2/rulesets/{ruleset_id}', data)) and 'errors' not in response:
-            for field in ('createdAt', 'updatedAt'):
-                if field in response:
-                    data.pop(field)
-
-        return response
+        return _clean(self._put(_RULESET_URL(ruleset_id), data), _STRIP_RULESET)
 
     def put_rule(self, ruleset_id: str, rule_id: str, data: Dict) -> Optional[Dict]:
         """
@@ -376,16 +684,11 @@ class API:
         Returns:
             The response from the platform when the request is successful, nothing otherwise.
         """
-        if (response := self._put(f'https://api.threatstack.com/v2/rulesets/{ruleset_id}/rules/{rule_id}', data)) and 'errors' not in response:
-            for field in ('createdAt', 'updatedAt', 'rulesetId'):
-                if field in response:
-                    response.pop(field)
-
-        return response
+        return _clean(self._put(_RULE_URL(ruleset_id, rule_id), data), _STRIP_RULE)
 
     # I am purposely skipping `put_suppressions`, since they can be updated via put_rule.
 
-    @retry(tries=5)
+    @retry(tries=5, exceptions=_RETRYABLE)
     def _delete(self, url: str) -> Optional[Dict]:
         """
         DELETE request on a TS API endpoint using Hawk Auth.
@@ -396,25 +699,15 @@ class API:
         Returns:
             A response on that endpoint, or nothing if an error is returned.
         """
-        self._update_sender(url, 'DELETE')
+        header = self._sign(url, 'DELETE')
 
-        response = requests.delete(
-            url=url,
-            headers={
-                'Authorization': self._header,
-                'Content-Type': 'application/json'
-            }
+        response = self._session.delete(
+            url,
+            headers={'Authorization': header},
+            timeout=_TIMEOUT
         )
 
-        try:
-            return response.json()
-        except json.JSONDecodeError:
-            if response.status_code == HTTPStatus.TOO_MANY_REQUESTS:
-                raise RateLimitedError(delay=float(response.headers['x-rate-limit-reset']) / 1_000 + 0.25)
-            else:
-                raise URLError(
-                    f'Did not get valid JSON in response: {response.text if response.text else response.reason} ~ {response.status_code}'
-                )
+        return _decode(response.status_code, response.headers, response.content, response.reason)
 
     def delete_rule(self, ruleset_id: str, rule_id: str) -> Optional[Dict]:
         """
@@ -429,7 +722,7 @@ class API:
         Returns:
             An empty dict if the rule deletion was successful.
         """
-        response = self._delete(f'https://api.threatstack.com/v2/rulesets/{ruleset_id}/rules/{rule_id}')
+        response = self._delete(_RULE_URL(ruleset_id, rule_id))
 
         return response
 
@@ -445,11 +738,11 @@ class API:
         Returns:
             A dict containing a list of server_ids that were assigned this ruleset.
         """
-        response = self._delete(f'https://api.threatstack.com/v2/rulesets/{ruleset_id}')
+        response = self._delete(_RULESET_URL(ruleset_id))
 
         return response
 
-    @retry(tries=5)
+    @retry(tries=5, exceptions=_POST_RETRYABLE)
     def _post(self, url: str, data: Dict) -> Optional[Dict]:
         """
         POST request on a TS API endpoint using Hawk Auth.
@@ -461,26 +754,17 @@ class API:
         Returns:
             A response on that endpoint, or nothing if an error is returned.
         """
-        self._update_sender(url, 'POST', data)
+        content = json.dumps(data)
+        header = self._sign(url, 'POST', content)
 
-        response = requests.post(
-            url=url,
-            data=json.dumps(data),
-            headers={
-                'Authorization': self._header,
-                'Content-Type': 'application/json'
-            }
+        response = self._session.post(
+            url,
+            data=content,
+            headers={'Authorization': header},
+            timeout=_TIMEOUT
         )
 
-        try:
-            return response.json()
-        except json.JSONDecodeError:
-            if response.status_code == HTTPStatus.TOO_MANY_REQUESTS:
-                raise RateLimitedError(delay=float(response.headers['x-rate-limit-reset']) / 1_000 + 0.25)
-            else:
-                raise URLError(
-                    f'Did not get valid JSON in response: {response.text if response.text else response.reason} ~ {response.status_code}'
-                )
+        return _decode(response.status_code, response.headers, response.content, response.reason)
 
     def post_rule(self, ruleset_id: str, data: Dict) -> Optional[Dict]:
         """
@@ -496,12 +780,7 @@ class API:
             The newly-generated rule's JSON, including its platform-assigned ID that should be propagated back through
             local directory structure (through renaming the directories).
         """
-        if (response := self._post(f'https://api.threatstack.com/v2/rulesets/{ruleset_id}/rules', data)) and 'errors' not in response:
-            for field in ('createdAt', 'updatedAt', 'rulesetId'):
-                if field in response:
-                    response.pop(field)
-
-        return response
+        return _clean(self._post(_RULESET_RULES_URL(ruleset_id), data), _STRIP_RULE)
 
     def post_ruleset(self, data: Dict) -> Optional[Dict]:
         """
@@ -516,12 +795,7 @@ class API:
             The newly-generated rulesets JSON, including its platform-assigned ID that should be propagated back
             through local directory structure (through renaming the directories).
         """
-        if (response := self._post(f'https://api.threatstack.com/v2/rulesets', data)) and 'errors' not in response:
-            for field in ('createdAt', 'updatedAt'):
-                if field in response:
-                    response.pop(field)
-
-        return response
+        return _clean(self._post(_RULESETS_URL, data), _STRIP_RULESET)
 
     def post_tags(self, rule_id: str, data: Dict) -> Optional[Dict]:
         """
@@ -536,6 +810,6 @@ class API:
         Returns:
             The same object as was submitted, if the request was successful.
         """
-        response = self._post(f'https://api.threatstack.com/v2/rules/{rule_id}/tags', data)
+        response = self._post(_TAGS_URL(rule_id), data)
 
         return response
@@ -0,0 +1,223 @@
+"""
+Asynchronous (read-only) API calls to TS.
+
+The synchronous `API` issues one request at a time per thread over HTTP/1.1. For bulk reads, such as pulling every
+ruleset's rules on a refresh, this client multiplexes all requests over a single HTTP/2 connection instead, so N
+round-trips overlap and only one TLS handshake is paid for. Responses are returned in the same POSTable format as
+`API`'s, and requests are retried on the same terms.
+"""
+
+from typing import Optional, Dict, List, Any, Generator
+
+import asyncio
+import logging
+import httpx
+
+from urllib.error import URLError
+from mohawk import Sender
+from random import uniform
+from .api import (
+    RateLimitedError, RetryLimitExceeded, _RULESETS_URL, _RULESET_URL, _RULESET_RULES_URL, _RULE_URL, _TAGS_URL,
+    _STRIP_RULESET, _STRIP_RULE, _STRIP_RULE_ID, _clean, _rename_rules, _decode, _backoff_delays
+)
+
+
+class HawkAuth(httpx.Auth):
+    """
+    Sign each outgoing request with a fresh Hawk Authorization header.
+    """
+    requires_request_body = True
+
+    def __init__(self, user_id: str, api_key: str, org_id: str) -> None:
+        self._ext = org_id
+        self._credentials = {
+            'id': user_id,
+            'key': api_key,
+            'algorithm': 'sha256'
+        }
+
+    def auth_flow(self, request: httpx.Request) -> Generator[httpx.Request, httpx.Response, None]:
+        request.headers['Authorization'] = Sender(
+            credentials=self._credentials,
+            url=str(request.url),
+            content=request.content or None,
+            method=request.method,
+            always_hash_content=False,
+            content_type='application/json',
+            ext=self._ext
+        ).request_header
+        yield request
+
+
+class AsyncAPI:
+    """
+    Asynchronous counterpart to `API` for bulk reads of the remote organizations' state.
+    """
+    def __init__(self, user_id: str, api_key: str, org_id: str, tries: int =5, max_concurrency: int =8) -> None:
+        self._tries = tries
+        self._max_concurrency = max_concurrency
+        self._client = httpx.AsyncClient(
+            auth=HawkAuth(user_id, api_key, org_id),
+            headers={'Content-Type': 'application/json'},
+            timeout=httpx.Timeout(30.0, connect=3.05),
+            # As with `API`'s adapter, only connection attempts are retried by the transport; everything else goes
+            # through `_get`, which re-signs each attempt.
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                retries=3,
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=10)
+            )
+        )
+
+    async def __aenter__(self) -> 'AsyncAPI':
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """
+        Close the underlying client and its connections.
+
+        Returns:
+            Nothing.
+        """
+        await self._client.aclose()
+
+    async def _get(self, url: str) -> Optional[Dict]:
+        """
+        GET request on a TS API endpoint using Hawk Auth, retried on the same terms as `API._get`.
+
+        Args:
+            url: the url (including endpoint and content) on which to make the request.
+
+        Returns:
+            A response on that endpoint.
+
+        Raises:
+            RetryLimitExceeded: if every try failed, be it on rate limiting, invalid JSON, or the connection.
+        """
+        delays = _backoff_delays()
+        last_exc: Optional[Exception] = None
+        for attempt in range(1, self._tries + 1):
+            try:
+                response = await self._client.get(url)
+                return _decode(response.status_code, response.headers, response.content, response.reason_phrase)
+            except RateLimitedError as msg:
+                logging.info('Retrying: %s', msg)
+                last_exc = msg
+                if attempt == self._tries:
+                    break
+                await asyncio.sleep(msg.delay + uniform(0, 0.5))
+            except (URLError, httpx.TransportError) as msg:
+                # Transport errors include connect and read timeouts.
+                logging.info('Retrying: %s', msg)
+                last_exc = msg
+                if attempt == self._tries:
+                    break
+                await asyncio.sleep(next(delays))
+
+        raise RetryLimitExceeded(f'GET {url} failed after {self._tries} tries: {last_exc}') from last_exc
+
+    async def get_rulesets(self) -> Optional[Dict]:
+        """
+        Return a list of rulesets and rules thereunder; cf. `API.get_rulesets`.
+
+        Returns:
+            A dictionary of rulesets and their rules.
+        """
+        if (response := await self._get(_RULESETS_URL)) and 'errors' not in response:
+            for ruleset in response['rulesets']:
+                _rename_rules(ruleset)
+
+        return response
+
+    async def get_ruleset(self, ruleset_id: str) -> Optional[Dict]:
+        """
+        Return a particular ruleset and rule IDs thereunder; cf. `API.get_ruleset`.
+
+        Args:
+            ruleset_id: ruleset ID we'd like to retrieve.
+
+        Returns:
+            The ruleset and rule IDs thereunder.
+        """
+        return _clean(await self._get(_RULESET_URL(ruleset_id)), _STRIP_RULESET, rename_rules=True)
+
+    async def get_ruleset_rules(self, ruleset_id: str) -> Optional[Dict]:
+        """
+        List out all rules under a ruleset verbosely; cf. `API.get_ruleset_rules`.
+
+        Args:
+            ruleset_id: ruleset under which to retrieve all rules.
+
+        Returns:
+            The ruleset and a verbose listing of the rules underneath it.
+        """
+        return _clean(await self._get(_RULESET_RULES_URL(ruleset_id)), rule_fields=_STRIP_RULE, rename_rules=True)
+
+    async def get_rule(self, ruleset_id: str, rule_id: str) -> Optional[Dict]:
+        """
+        Get a particular rule from a ruleset; cf. `API.get_rule`.
+
+        Args:
+            ruleset_id: ruleset ID from which to retrieve the rule.
+            rule_id: rule ID to retrieve from this ruleset.
+
+        Returns:
+            The rule data.
+        """
+        return _clean(await self._get(_RULE_URL(ruleset_id, rule_id)), _STRIP_RULE_ID)
+
+    async def get_rule_tags(self, rule_id: str) -> Optional[Dict]:
+        """
+        Get tags on a rule; cf. `API.get_rule_tags`.
+
+        Args:
+            rule_id: rule ID on which to retrieve the assigned EC2 tags.
+
+        Returns:
+            The tag data.
+        """
+        return await self._get(_TAGS_URL(rule_id))
+
+    async def get_all_ruleset_rules(self, ruleset_ids: List[str]) -> Dict[str, Optional[Dict]]:
+        """
+        Retrieve the rules under several rulesets concurrently over the shared HTTP/2 connection, with at most
+        `max_concurrency` requests in flight.
+
+        Args:
+            ruleset_ids: rulesets under which to retrieve all rules.
+
+        Returns:
+            A dictionary mapping each ruleset ID to the response `get_ruleset_rules` returned for it.
+        """
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        async def fetch(ruleset_id: str) -> Optional[Dict]:
+            async with semaphore:
+                return await self.get_ruleset_rules(ruleset_id)
+
+        responses = await asyncio.gather(*(fetch(ruleset_id) for ruleset_id in ruleset_ids))
+        return dict(zip(ruleset_ids, responses))
+
+
+def get_all_ruleset_rules(user_id: str, api_key: str, org_id: str, ruleset_ids: List[str]) -> Dict[str, Optional[Dict]]:
+    """
+    Synchronous entry point to `AsyncAPI.get_all_ruleset_rules`, for callers (like `State.refresh`) that aren't running
+    an event loop. If any fetch fails, the rest are cancelled when the loop shuts down.
+
+    Args:
+        user_id: TS user ID.
+        api_key: TS API key.
+        org_id: TS organization ID.
+        ruleset_ids: rulesets under which to retrieve all rules.
+
+    Returns:
+        A dictionary mapping each ruleset ID to the response `get_ruleset_rules` returned for it.
+    """
+    async def _run() -> Dict[str, Optional[Dict]]:
+        async with AsyncAPI(user_id, api_key, org_id) as api:
+            return await api.get_all_ruleset_rules(ruleset_ids)
+
+    return asyncio.run(_run())
@@ -14,6 +14,7 @@ from functools import wraps
 from urllib.error import URLError
 from uuid import uuid4
 from .api import API
+from .api_async import get_all_ruleset_rules
 from .utils import read_json, write_json, Color
 from . import lazy_eval
 
@@ -108,194 +109,193 @@ class State:
         state = read_json(self.state_file)
 
         if self.org_id in state['organizations']:
-            api = API(**self.credentials)
-
-            for ruleset_id in list(state['organizations'][self.org_id]):
-                # Check if this ruleset is to just be deleted, since updates and creation depend on a directory
-                # structure to be present.
-                if state['organizations'][self.org_id][ruleset_id]['modified'] == 'del':
-                    try:
-                        logging.info(f'Deleting ruleset \'{ruleset_id}\'.')
-                        api.delete_ruleset(ruleset_id)
-                        state['organizations'][self.org_id].pop(ruleset_id)
-                    except URLError as msg:
-                        # Continue to next ruleset, deletion as unsuccessful.
-                        logging.error(f'Failed to delete ruleset ID \'{ruleset_id}\': {msg}.')
-                    continue
-
-                ruleset_dir = f'{self.organization_dir}{ruleset_id}/'
-                ruleset_data = read_json(ruleset_dir + 'ruleset.json')
-                if ruleset_id.endswith(self._postfix):
-                    # It's a new ruleset, the result of a copy or creation. We need to strip out any rules in the
-                    # JSON that are `-localonly` as well, because the platform won't know what to do with them until
-                    # the ruleset is created.
-                    localonly_rules = ruleset_data['ruleIds']
-                    ruleset_data['ruleIds'] = []
-                    try:
-                        logging.info(f'Creating ruleset: {ruleset_id}.')
-                        ruleset_response = api.post_ruleset(ruleset_data)
-                        new_ruleset_id = ruleset_response['id']
-                        logging.debug(f'New ruleset ID: {new_ruleset_id}.')
-                    except URLError as msg:
-                        # Skip the rule requests, since there's no ruleset to post rules to. User will have to re-run.
-                        logging.error(f'Failed to create ruleset ID \'{ruleset_id}\': {msg}.')
-                        continue
-
-                    # Now let's go back and append all of these new rules to the ruleset, and update our local records
-                    # for effect.
-                    for rule_id in localonly_rules:
-                        rule_dir = f'{ruleset_dir}{rule_id}/'
-                        rule_data = read_json(rule_dir + 'rule.json')
-                        tags_data = read_json(rule_dir + 'tags.json')
-
-                        try:
-                            logging.info(f'Creating rule ID \'{rule_id}\'.')
-                            rule_response = api.post_rule(new_ruleset_id, rule_data)
-                            if 'errors' in rule_response:
-                                raise URLError(rule_response)
-                            state['organizations'][self.org_id][ruleset_id]['ruleIds'][rule_id] = 'tags'
-                            new_rule_id = rule_response['id']
-                            shutil.move(rule_dir, f'{ruleset_dir}{new_rule_id}/')
-                            ruleset_data['ruleIds'].append(new_rule_id)
-                        except URLError as msg:
-                            logging.error(f'Failed to create rule ID \'{rule_id}\': {msg}.')
-                            continue
-
+            with API(**self.credentials) as api:
+                for ruleset_id in list(state['organizations'][self.org_id]):
+                    # Check if this ruleset is to just be deleted, since updates and creation depend on a directory
+                    # structure to be present.
+                    if state['organizations'][self.org_id][ruleset_id]['modified'] == 'del':
                         try:
-                            logging.info(f'Creating tags on rule ID \'{rule_id}\'.')
-                            api.post_tags(new_rule_id, tags_data)
-                            if state['organizations'][self.org_id][ruleset_id]['ruleIds'][rule_id] == 'tags':
-                                state['organizations'][self.org_id][ruleset_id]['ruleIds'].pop(rule_id)
-                            else:
-                                state['organizations'][self.org_id][ruleset_id]['ruleIds'][rule_id] = 'rule'
+                            logging.info(f'Deleting ruleset \'{ruleset_id}\'.')
+                            api.delete_ruleset(ruleset_id)
+                            state['organizations'][self.org_id].pop(ruleset_id)
                         except URLError as msg:
-                            logging.error(f'Failed to update tags on rule ID \'{rule_id}\': {msg}.')
-                            continue
-
-                    # Propagate the assigned ruleset and rule IDs received from the platform back to the directory
-                    # structure.
-                    new_ruleset_dir = f'{self.organization_dir}{new_ruleset_id}/'
-                    shutil.move(ruleset_dir, new_ruleset_dir)
-                    write_json(new_ruleset_dir + 'ruleset.json', ruleset_data)
-
-                    if len(state['organizations'][self.org_id][ruleset_id]['ruleIds']) == 0:
-                        state['organizations'][self.org_id].pop(ruleset_id)
-                    else:
-                        # Update the state file to the new ruleset ID, there are still `-localonly` rules, be it a tags
-                        # endpoint update, or otherwise, that need to be updated on this new ruleset ID due to failures.
-                        state['organizations'][self.org_id][new_ruleset_id] = state['organizations'][self.org_id][ruleset_id]
-                        state['organizations'][self.org_id].pop(ruleset_id)
-                else:
-                    # It's a ruleset that already existed, but there could be `-localonly` (new) rules on it.
-                    localonly_rules = [rule_id for rule_id in ruleset_data['ruleIds'] if rule_id.endswith(self._postfix)]
-                    ruleset_data['ruleIds'] = [rule_id for rule_id in ruleset_data['ruleIds'] if not rule_id.endswith(self._postfix)]
-
-                    if state['organizations'][self.org_id][ruleset_id]['modified'] == 'true':
-                        try:
-                            logging.info('Updating ruleset ID \'{ruleset_id}\'.')
-                            api.put_ruleset(ruleset_id, ruleset_data)
-                            state['organizations'][self.org_id][ruleset_id]['modified'] = 'false'
-                        except URLError as msg:
-                            # Unlike the other branch, we don't need to skip the rules, because this ruleset does indeed
-                            # exist remotely, it just needs to be updated if the POST request fails.
-                            logging.error(f'Failed to update ruleset ID \'{ruleset_id}\': {msg}.')
-                            pass
-
-                    # Loop over new rules that need to be created in the platform, propagate their new IDs back.
-                    for rule_id in localonly_rules:
-                        rule_dir = f'{ruleset_dir}{rule_id}/'
-                        rule_data = read_json(rule_dir + 'rule.json')
-                        tags_data = read_json(rule_dir + 'tags.json')
-
-                        try:
-                            logging.info(f'Creating rule ID \'{rule_id}\'.')
-                            rule_response = api.post_rule(ruleset_id, rule_data)
-                            if 'errors' in rule_response:
-                                raise URLError(rule_response)
-                            state['organizations'][self.org_id][ruleset_id]['ruleIds'][rule_id] = 'tags'
-                            new_rule_id = rule_response['id']
-                            shutil.move(rule_dir, f'{ruleset_dir}{new_rule_id}/')
-                            ruleset_data['ruleIds'].append(new_rule_id)
-                        except URLError as msg:
-                            # Request to update failed, remain tracking in state file.
-                            logging.error(f'Failed to update rule ID \'{rule_id}\': {msg}')
-                            continue
+                            # Continue to next ruleset, deletion as unsuccessful.
+                            logging.error(f'Failed to delete ruleset ID \'{ruleset_id}\': {msg}.')
+                        continue
 
+                    ruleset_dir = f'{self.organization_dir}{ruleset_id}/'
+                    ruleset_data = read_json(ruleset_dir + 'ruleset.json')
+                    if ruleset_id.endswith(self._postfix):
+                        # It's a new ruleset, the result of a copy or creation. We need to strip out any rules in the
+                        # JSON that are `-localonly` as well, because the platform won't know what to do with them until
+                        # the ruleset is created.
+                        localonly_rules = ruleset_data['ruleIds']
+                        ruleset_data['ruleIds'] = []
                         try:
-                            logging.info(f'Updating tags on rule ID \'{rule_id}\'.')
-                            api.post_tags(new_rule_id, tags_data)
-                            if state['organizations'][self.org_id][ruleset_id]['ruleIds'][rule_id] == 'tags':
-                                state['organizations'][self.org_id][ruleset_id]['ruleIds'].pop(rule_id)
-                            else:
-                                state['organizations'][self.org_id][ruleset_id]['ruleIds'][rule_id] = 'rule'
+                            logging.info(f'Creating ruleset: {ruleset_id}.')
+                            ruleset_response = api.post_ruleset(ruleset_data)
+                            new_ruleset_id = ruleset_response['id']
+                            logging.debug(f'New ruleset ID: {new_ruleset_id}.')
                         except URLError as msg:
-                            logging.error(f'Failed to update tags on rule ID \'{rule_id}\': {msg}.')
+                            # Skip the rule requests, since there's no ruleset to post rules to. User will have to re-run.
+                            logging.error(f'Failed to create ruleset ID \'{ruleset_id}\': {msg}.')
                             continue
 
-                    # Since there are new rule IDs, write this data to the ruleset for tracking.
-                    write_json(ruleset_dir + 'ruleset.json', ruleset_data)
-
-                    # Now loop over rules that exist in the platform, but need to be modified in some fashion.
-                    for rule_id in list(state['organizations'][self.org_id][ruleset_id]['ruleIds']):
-                        rule_dir = f'{ruleset_dir}{rule_id}/'
-
-                        if state['organizations'][self.org_id][ruleset_id]['ruleIds'][rule_id] == 'rule':
+                        # Now let's go back and append all of these new rules to the ruleset, and update our local records
+                        # for effect.
+                        for rule_id in localonly_rules:
+                            rule_dir = f'{ruleset_dir}{rule_id}/'
                             rule_data = read_json(rule_dir + 'rule.json')
+                            tags_data = read_json(rule_dir + 'tags.json')
+
                             try:
-                                logging.info(f'Updating rule ID \'{rule_id}\'.')
-                                api.put_rule(ruleset_id, rule_id, rule_data)
-                                state['organizations'][self.org_id][ruleset_id]['ruleIds'].pop(rule_id)
+                                logging.info(f'Creating rule ID \'{rule_id}\'.')
+                                rule_response = api.post_rule(new_ruleset_id, rule_data)
+                                if 'errors' in rule_response:
+                                    raise URLError(rule_response)
+                                state['organizations'][self.org_id][ruleset_id]['ruleIds'][rule_id] = 'tags'
+                                new_rule_id = rule_response['id']
+                                shutil.move(rule_dir, f'{ruleset_dir}{new_rule_id}/')
+                                ruleset_data['ruleIds'].append(new_rule_id)
                             except URLError as msg:
-                                logging.error(f'Failed to update rule JSON on rule ID \'{rule_id}\': {msg}.')
+                                logging.error(f'Failed to create rule ID \'{rule_id}\': {msg}.')
                                 continue
-                        elif state['organizations'][self.org_id][ruleset_id]['ruleIds'][rule_id] == 'tags':
-                            tags_data = read_json(rule_dir + 'tags.json')
+
                             try:
-                                logging.info(f'Updating tags on rule ID \'{rule_id}\'.')
-                                api.post_tags(rule_id, tags_data)
-                                state['organizations'][self.org_id][ruleset_id]['ruleIds'].pop(rule_id)
+                                logging.info(f'Creating tags on rule ID \'{rule_id}\'.')
+                                api.post_tags(new_rule_id, tags_data)
+                                if state['organizations'][self.org_id][ruleset_id]['ruleIds'][rule_id] == 'tags':
+                                    state['organizations'][self.org_id][ruleset_id]['ruleIds'].pop(rule_id)
+                                else:
+                                    state['organizations'][self.org_id][ruleset_id]['ruleIds'][rule_id] = 'rule'
                             except URLError as msg:
                                 logging.error(f'Failed to update tags on rule ID \'{rule_id}\': {msg}.')
                                 continue
-                        elif state['organizations'][self.org_id][ruleset_id]['ruleIds'][rule_id] == 'both':
-                            # Attempt both updates, though this code is kinda duplicated.
+
+                        # Propagate the assigned ruleset and rule IDs received from the platform back to the directory
+                        # structure.
+                        new_ruleset_dir = f'{self.organization_dir}{new_ruleset_id}/'
+                        shutil.move(ruleset_dir, new_ruleset_dir)
+                        write_json(new_ruleset_dir + 'ruleset.json', ruleset_data)
+
+                        if len(state['organizations'][self.org_id][ruleset_id]['ruleIds']) == 0:
+                            state['organizations'][self.org_id].pop(ruleset_id)
+                        else:
+                            # Update the state file to the new ruleset ID, there are still `-localonly` rules, be it a tags
+                            # endpoint update, or otherwise, that need to be updated on this new ruleset ID due to failures.
+                            state['organizations'][self.org_id][new_ruleset_id] = state['organizations'][self.org_id][ruleset_id]
+                            state['organizations'][self.org_id].pop(ruleset_id)
+                    else:
+                        # It's a ruleset that already existed, but there could be `-localonly` (new) rules on it.
+                        localonly_rules = [rule_id for rule_id in ruleset_data['ruleIds'] if rule_id.endswith(self._postfix)]
+                        ruleset_data['ruleIds'] = [rule_id for rule_id in ruleset_data['ruleIds'] if not rule_id.endswith(self._postfix)]
+
+                        if state['organizations'][self.org_id][ruleset_id]['modified'] == 'true':
+                            try:
+                                logging.info('Updating ruleset ID \'{ruleset_id}\'.')
+                                api.put_ruleset(ruleset_id, ruleset_data)
+                                state['organizations'][self.org_id][ruleset_id]['modified'] = 'false'
+                            except URLError as msg:
+                                # Unlike the other branch, we don't need to skip the rules, because this ruleset does indeed
+                                # exist remotely, it just needs to be updated if the POST request fails.
+                                logging.error(f'Failed to update ruleset ID \'{ruleset_id}\': {msg}.')
+                                pass
+
+                        # Loop over new rules that need to be created in the platform, propagate their new IDs back.
+                        for rule_id in localonly_rules:
+                            rule_dir = f'{ruleset_dir}{rule_id}/'
                             rule_data = read_json(rule_dir + 'rule.json')
+                            tags_data = read_json(rule_dir + 'tags.json')
 
                             try:
-                                logging.info(f'Updating rule ID \'{rule_id}\'.')
-                                api.put_rule(ruleset_id, rule_id, rule_data)
+                                logging.info(f'Creating rule ID \'{rule_id}\'.')
+                                rule_response = api.post_rule(ruleset_id, rule_data)
+                                if 'errors' in rule_response:
+                                    raise URLError(rule_response)
                                 state['organizations'][self.org_id][ruleset_id]['ruleIds'][rule_id] = 'tags'
+                                new_rule_id = rule_response['id']
+                                shutil.move(rule_dir, f'{ruleset_dir}{new_rule_id}/')
+                                ruleset_data['ruleIds'].append(new_rule_id)
                             except URLError as msg:
-                                logging.error(f'Failed to update rule ID \'{rule_id}\': {msg}.')
+                                # Request to update failed, remain tracking in state file.
+                                logging.error(f'Failed to update rule ID \'{rule_id}\': {msg}')
                                 continue
 
-                            tags_data = read_json(rule_dir + 'tags.json')
-
                             try:
                                 logging.info(f'Updating tags on rule ID \'{rule_id}\'.')
-                                api.post_tags(rule_id, tags_data)
-                                state['organizations'][self.org_id][ruleset_id]['ruleIds'].pop(rule_id)
+                                api.post_tags(new_rule_id, tags_data)
+                                if state['organizations'][self.org_id][ruleset_id]['ruleIds'][rule_id] == 'tags':
+                                    state['organizations'][self.org_id][ruleset_id]['ruleIds'].pop(rule_id)
+                                else:
+                                    state['organizations'][self.org_id][ruleset_id]['ruleIds'][rule_id] = 'rule'
                             except URLError as msg:
                                 logging.error(f'Failed to update tags on rule ID \'{rule_id}\': {msg}.')
                                 continue
 
-                        elif state['organizations'][self.org_id][ruleset_id]['ruleIds'][rule_id] == 'del':
-                            try:
-                                logging.info(f'Deleting rule ID \'{rule_id}\'.')
-                                api.delete_rule(ruleset_id, rule_id)
-                                state['organizations'][self.org_id][ruleset_id]['ruleIds'].pop(rule_id)
-                            except URLError as msg:
-                                # Continue to next rule, deletion was unsuccessful.
-                                logging.error(f'Failed on deletion of rule ID \'{rule_id}\': {msg}')
-                            continue
+                        # Since there are new rule IDs, write this data to the ruleset for tracking.
+                        write_json(ruleset_dir + 'ruleset.json', ruleset_data)
+
+                        # Now loop over rules that exist in the platform, but need to be modified in some fashion.
+                        for rule_id in list(state['organizations'][self.org_id][ruleset_id]['ruleIds']):
+                            rule_dir = f'{ruleset_dir}{rule_id}/'
+
+                            if state['organizations'][self.org_id][ruleset_id]['ruleIds'][rule_id] == 'rule':
+                                rule_data = read_json(rule_dir + 'rule.json')
+                                try:
+                                    logging.info(f'Updating rule ID \'{rule_id}\'.')
+                                    api.put_rule(ruleset_id, rule_id, rule_data)
+                                    state['organizations'][self.org_id][ruleset_id]['ruleIds'].pop(rule_id)
+                                except URLError as msg:
+                                    logging.error(f'Failed to update rule JSON on rule ID \'{rule_id}\': {msg}.')
+                                    continue
+                            elif state['organizations'][self.org_id][ruleset_id]['ruleIds'][rule_id] == 'tags':
+                                tags_data = read_json(rule_dir + 'tags.json')
+                                try:
+                                    logging.info(f'Updating tags on rule ID \'{rule_id}\'.')
+                                    api.post_tags(rule_id, tags_data)
+                                    state['organizations'][self.org_id][ruleset_id]['ruleIds'].pop(rule_id)
+                                except URLError as msg:
+                                    logging.error(f'Failed to update tags on rule ID \'{rule_id}\': {msg}.')
+                                    continue
+                            elif state['organizations'][self.org_id][ruleset_id]['ruleIds'][rule_id] == 'both':
+                                # Attempt both updates, though this code is kinda duplicated.
+                                rule_data = read_json(rule_dir + 'rule.json')
+
+                                try:
+                                    logging.info(f'Updating rule ID \'{rule_id}\'.')
+                                    api.put_rule(ruleset_id, rule_id, rule_data)
+                                    state['organizations'][self.org_id][ruleset_id]['ruleIds'][rule_id] = 'tags'
+                                except URLError as msg:
+                                    logging.error(f'Failed to update rule ID \'{rule_id}\': {msg}.')
+                                    continue
+
+                                tags_data = read_json(rule_dir + 'tags.json')
+
+                                try:
+                                    logging.info(f'Updating tags on rule ID \'{rule_id}\'.')
+                                    api.post_tags(rule_id, tags_data)
+                                    state['organizations'][self.org_id][ruleset_id]['ruleIds'].pop(rule_id)
+                                except URLError as msg:
+                                    logging.error(f'Failed to update tags on rule ID \'{rule_id}\': {msg}.')
+                                    continue
+
+                            elif state['organizations'][self.org_id][ruleset_id]['ruleIds'][rule_id] == 'del':
+                                try:
+                                    logging.info(f'Deleting rule ID \'{rule_id}\'.')
+                                    api.delete_rule(ruleset_id, rule_id)
+                                    state['organizations'][self.org_id][ruleset_id]['ruleIds'].pop(rule_id)
+                                except URLError as msg:
+                                    # Continue to next rule, deletion was unsuccessful.
+                                    logging.error(f'Failed on deletion of rule ID \'{rule_id}\': {msg}')
+                                continue
 
-                    if state['organizations'][self.org_id][ruleset_id]['modified'] == 'false' and \
-                            len(state['organizations'][self.org_id][ruleset_id]['ruleIds']) == 0:
-                        state['organizations'][self.org_id].pop(ruleset_id)
-            else:
-                if len(state['organizations'][self.org_id]) == 0:
-                    state['organizations'].pop(self.org_id)
-                write_json(self.state_file, state)
+                        if state['organizations'][self.org_id][ruleset_id]['modified'] == 'false' and \
+                                len(state['organizations'][self.org_id][ruleset_id]['ruleIds']) == 0:
+                            state['organizations'][self.org_id].pop(ruleset_id)
+                else:
+                    if len(state['organizations'][self.org_id]) == 0:
+                        state['organizations'].pop(self.org_id)
+                    write_json(self.state_file, state)
         else:
             # Nothing to do.
             return None
@@ -330,57 +330,60 @@ class State:
             if ruleset != '.backup' and ruleset != '.remote':
                 shutil.move(self.organization_dir + ruleset, backup_dir + ruleset)
 
-        api = API(**self.credentials)
-
-        # Collect rulesets under this organization and create corresponding directories.
-        try:
-            rulesets = api.get_rulesets()
-
-            if not rulesets:
-                logging.error(f'Could not retrieve rulesets from the organization with the provided credentials.')
-                return None
-            elif 'errors' in rulesets:
-                logging.error(f'Could not retrieve organization with the provided credentials: {rulesets["errors"]}.')
-                return None
-
-            for ruleset in rulesets['rulesets']:
-                ruleset_id = ruleset['id']
-
-                # Remove fields that aren't POSTable from the rulesets' data.
-                for field in ('id', 'createdAt', 'updatedAt'):
-                    ruleset.pop(field)
-
-                logging.debug(f'Refreshing ruleset ID \'{ruleset_id}\'')
-
-                ruleset_rules = api.get_ruleset_rules(ruleset_id)
-                ruleset_dir = remote_dir + ruleset_id + '/'
-                os.mkdir(ruleset_dir)
-                write_json(ruleset_dir + 'ruleset.json', ruleset)
-
-                for rule in ruleset_rules['ruleIds']:
-                    rule_id = rule['id']
-                    logging.debug(f'\tPulling rule and tag JSON on rule ID \'{rule_id}\'')
-                    rule_tags = api.get_rule_tags(rule_id)
-                    rule_dir = ruleset_dir + rule_id + '/'
-                    os.mkdir(rule_dir)
-                    write_json(rule_dir + 'rule.json', rule)
-                    write_json(rule_dir + 'tags.json', rule_tags)
-        except (URLError, KeyboardInterrupt):
-            # Restore backup, refresh unsuccessful; delete remote state directory.
-            logging.error(f'Could not refresh organization {self.org_id} local state, restoring backup')
-            shutil.rmtree(remote_dir)
-            for ruleset in os.listdir(backup_dir):
-                shutil.move(backup_dir + ruleset, self.organization_dir + ruleset)
+        with API(**self.credentials) as api:
+            # Collect rulesets under this organization and create corresponding directories.
+            try:
+                rulesets = api.get_rulesets()
+
+                if not rulesets:
+                    logging.error(f'Could not retrieve rulesets from the organization with the provided credentials.')
+                    return None
+                elif 'errors' in rulesets:
+                    logging.error(f'Could not retrieve organization with the provided credentials: {rulesets["errors"]}.')
+                    return None
+
+                all_ruleset_rules = get_all_ruleset_rules(
+                    ruleset_ids=[ruleset['id'] for ruleset in rulesets['rulesets']], **self.credentials
+                )
+
+                for ruleset in rulesets['rulesets']:
+                    ruleset_id = ruleset['id']
+
+                    # Remove fields that aren't POSTable from the rulesets' data.
+                    for field in ('id', 'createdAt', 'updatedAt'):
+                        ruleset.pop(field)
+
+                    logging.debug(f'Refreshing ruleset ID \'{ruleset_id}\'')
+
+                    ruleset_rules = all_ruleset_rules[ruleset_id]
+                    ruleset_dir = remote_dir + ruleset_id + '/'
+                    os.mkdir(ruleset_dir)
+                    write_json(ruleset_dir + 'ruleset.json', ruleset)
+
+                    for rule in ruleset_rules['ruleIds']:
+                        rule_id = rule['id']
+                        logging.debug(f'\tPulling rule and tag JSON on rule ID \'{rule_id}\'')
+                        rule_tags = api.get_rule_tags(rule_id)
+                        rule_dir = ruleset_dir + rule_id + '/'
+                        os.mkdir(rule_dir)
+                        write_json(rule_dir + 'rule.json', rule)
+                        write_json(rule_dir + 'tags.json', rule_tags)
+            except (URLError, KeyboardInterrupt):
+                # Restore backup, refresh unsuccessful; delete remote state directory.
+                logging.error(f'Could not refresh organization {self.org_id} local state, restoring backup')
+                shutil.rmtree(remote_dir)
+                for ruleset in os.listdir(backup_dir):
+                    shutil.move(backup_dir + ruleset, self.organization_dir + ruleset)
+                else:
+                    # backup directory should be clear, so let's remove it.
+                    os.rmdir(backup_dir)
             else:
-                # backup directory should be clear, so let's remove it.
-                os.rmdir(backup_dir)
-        else:
-            # Clear this organization's local state and delete the backup, refresh successful.
-            for ruleset in os.listdir(remote_dir):
-                shutil.move(remote_dir + ruleset, self.organization_dir + ruleset)
-            shutil.rmtree(backup_dir)
-            shutil.rmtree(remote_dir)
-            self._state_delete_organization(self.org_id)
+                # Clear this organization's local state and delete the backup, refresh successful.
+                for ruleset in os.listdir(remote_dir):
+                    shutil.move(remote_dir + ruleset, self.organization_dir + ruleset)
+                shutil.rmtree(backup_dir)
+                shutil.rmtree(remote_dir)
+                self._state_delete_organization(self.org_id)
 
     # Local state file management API.
 